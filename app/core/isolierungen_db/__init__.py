@@ -25,7 +25,7 @@ from .logic import (
     save_variant,
     unregister_material_change_listener,
 )
-from .services import build_import_summary, parse_optional_float, parse_required_float
+from .services import build_import_summary, parse_float_list, parse_optional_float, parse_required_float
 
 __all__ = [
     "CSV_HEADERS",
@@ -46,6 +46,7 @@ __all__ = [
     "import_insulations_from_csv_files",
     "interpolate_k",
     "load_insulation",
+    "parse_float_list",
     "parse_optional_float",
     "parse_required_float",
     "register_material_change_listener",
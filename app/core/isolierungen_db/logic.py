@@ -341,23 +341,20 @@ def interpolate_k(temps: list[float], ks: list[float], x_range: np.ndarray):
     temps_arr = temps_arr[order]
     ks_arr = ks_arr[order]
 
+    # Messpunkte mit (nahezu) gleicher Temperatur liegen nach dem Sortieren
+    # zusammenhängend; die Gruppengrenze entspricht der np.isclose-Toleranz.
+    group_ends = np.searchsorted(
+        temps_arr, temps_arr + 1e-8 + 1e-5 * np.abs(temps_arr), side="right"
+    )
     unique_temps: list[float] = []
     unique_ks: list[float] = []
     i = 0
     n = len(temps_arr)
     while i < n:
-        t = temps_arr[i]
-        same_idx = np.where(np.isclose(temps_arr, t))[0]
-        same_idx = same_idx[same_idx >= i]
-        if same_idx.size > 1:
-            mean_k = float(np.mean(ks_arr[same_idx]))
-            unique_temps.append(float(t))
-            unique_ks.append(mean_k)
-            i = int(same_idx[-1] + 1)
-        else:
-            unique_temps.append(float(t))
-            unique_ks.append(float(ks_arr[i]))
-            i += 1
+        end = int(group_ends[i])
+        unique_temps.append(float(temps_arr[i]))
+        unique_ks.append(float(np.mean(ks_arr[i:end])))
+        i = end
 
     temps_u = np.array(unique_temps)
     ks_u = np.array(unique_ks)
@@ -26,6 +26,18 @@ def parse_optional_float(value: str) -> float | None:
         raise ValueError("Numerischer Wert erwartet (optional).")
 
 
+def parse_float_list(value: str) -> list[float]:
+    cleaned = value.strip()
+    if not cleaned:
+        return []
+    separator = ";" if ";" in cleaned else ","
+    tokens = [part.strip().replace(",", ".") for part in cleaned.split(separator)]
+    try:
+        return [float(token) for token in tokens if token]
+    except ValueError as exc:
+        raise ValueError("Werteliste darf nur Zahlen enthalten.") from exc
+
+
 def build_import_summary(imported: int, results: list[FileImportResult]) -> str:
     lines = [f"{imported} Isolierung(en) importiert."]
     skipped = [r for r in results if r.skipped_reason]
@@ -1,9 +1,11 @@
 """Chart asset generation for report renderers."""
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
 from io import BytesIO
 
-from matplotlib.figure import Figure
+import numpy as np
 
 from app.core.reporting.report_document import ImageBlock, ReportDocument
 
@@ -25,6 +27,15 @@ def build_temperature_profile_chart(document: ReportDocument) -> bytes | None:
     if len(temperatures_c) < 2:
         return None
 
+    return _render_temperature_chart(tuple(thicknesses_mm), tuple(temperatures_c))
+
+
+@lru_cache(maxsize=16)
+def _render_temperature_chart(thicknesses_mm: tuple[float, ...], temperatures_c: tuple[float, ...]) -> bytes | None:
+    """Render the chart PNG; identical profiles reuse the encoded bytes across reports."""
+
+    from matplotlib.figure import Figure
+
     x_positions = _build_distance_axis(thicknesses_mm, len(temperatures_c))
     if len(x_positions) != len(temperatures_c):
         return None
@@ -44,7 +55,8 @@ def build_temperature_profile_chart(document: ReportDocument) -> bytes | None:
 
     buffer = BytesIO()
     figure.tight_layout()
-    figure.savefig(buffer, format="png")
+    # ReportLab recompresses the pixels when embedding, so fast PNG compression suffices.
+    figure.savefig(buffer, format="png", pil_kwargs={"compress_level": 1})
     return buffer.getvalue()
 
 
@@ -76,17 +88,15 @@ def _float_list(value: object) -> list[float]:
     return items
 
 
-def _build_distance_axis(thicknesses_mm: list[float], temperature_count: int) -> list[float]:
+def _build_distance_axis(thicknesses_mm: Sequence[float], temperature_count: int) -> list[float]:
     if len(thicknesses_mm) >= temperature_count - 1 and temperature_count >= 2:
-        cumulative = [0.0]
-        for thickness in thicknesses_mm[: temperature_count - 1]:
-            cumulative.append(cumulative[-1] + max(thickness, 0.0))
-        return cumulative
+        steps = np.clip(np.asarray(thicknesses_mm[: temperature_count - 1], dtype=np.float64), 0.0, None)
+        return np.concatenate(([0.0], np.cumsum(steps))).tolist()
 
     return [float(index) for index in range(temperature_count)]
 
 
-def _render_layer_background(axis: object, thicknesses_mm: list[float], x_positions: list[float]) -> None:
+def _render_layer_background(axis: object, thicknesses_mm: Sequence[float], x_positions: list[float]) -> None:
     palette = [
         "#2E5B9A",
         "#C25B4A",
@@ -95,18 +105,17 @@ def _render_layer_background(axis: object, thicknesses_mm: list[float], x_positi
         "#B88731",
         "#2C8A8A",
     ]
-    x_start = 0.0
-    for index, thickness in enumerate(thicknesses_mm):
-        x_end = x_start + max(0.0, float(thickness))
+    x_ends = np.cumsum(np.clip(np.asarray(thicknesses_mm, dtype=np.float64), 0.0, None))
+    x_starts = np.concatenate(([0.0], x_ends[:-1]))
+    for index, (x_start, x_end) in enumerate(zip(x_starts.tolist(), x_ends.tolist())):
         if x_end > x_start:
             axis.axvspan(x_start, x_end, color=palette[index % len(palette)], alpha=0.28, zorder=1)
-        x_start = x_end
 
     for boundary in x_positions:
         axis.axvline(boundary, color="#4b5563", linewidth=0.8, alpha=0.55, zorder=2)
 
 
-def _render_interface_markers(axis: object, x_positions: list[float], temperatures_c: list[float]) -> None:
+def _render_interface_markers(axis: object, x_positions: list[float], temperatures_c: Sequence[float]) -> None:
     if not x_positions or not temperatures_c:
         return
     t_min = min(temperatures_c)
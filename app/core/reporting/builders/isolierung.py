@@ -360,23 +360,31 @@ class _ClassificationTemperatureResolver:
 
 def _nested(mapping: Mapping[str, Any], key: str) -> dict[str, Any]:
     value = mapping.get(key)
+    if type(value) is dict:
+        return value
     if isinstance(value, Mapping):
         return dict(value)
     return {}
 
 
 def _as_mapping(value: Any) -> dict[str, Any]:
+    if type(value) is dict:
+        return value
     return dict(value) if isinstance(value, Mapping) else {}
 
 
 def _as_sequence(value: Any) -> list[Any]:
+    if type(value) is list:
+        return value
     return list(value) if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)) else []
 
 
 def _records_from(mapping: Mapping[str, Any], key: str) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for entry in _as_sequence(mapping.get(key)):
-        if isinstance(entry, Mapping):
+        if type(entry) is dict:
+            rows.append(entry)
+        elif isinstance(entry, Mapping):
             rows.append(dict(entry))
     return rows
 
@@ -384,7 +392,7 @@ def _records_from(mapping: Mapping[str, Any], key: str) -> list[dict[str, Any]]:
 def _as_text(value: Any, fallback: str = "") -> str:
     if value is None:
         return fallback
-    text = str(value).strip()
+    text = (value if type(value) is str else str(value)).strip()
     return text if text else fallback
 
 
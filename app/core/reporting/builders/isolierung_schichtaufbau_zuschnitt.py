@@ -225,23 +225,29 @@ def _table(*, title: str, columns: list[TableColumn], rows: list[dict[str, Any]]
 
 def _nested(mapping: Mapping[str, Any], key: str) -> dict[str, Any]:
     value = mapping.get(key)
+    if type(value) is dict:
+        return value
     if isinstance(value, Mapping):
         return dict(value)
     return {}
 
 
 def _as_mapping(value: Any) -> dict[str, Any]:
+    if type(value) is dict:
+        return value
     return dict(value) if isinstance(value, Mapping) else {}
 
 
 def _as_sequence(value: Any) -> list[Any]:
+    if type(value) is list:
+        return value
     return list(value) if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)) else []
 
 
 def _as_text(value: Any, fallback: str = "") -> str:
     if value is None:
         return fallback
-    text = str(value).strip()
+    text = (value if type(value) is str else str(value)).strip()
     return text if text else fallback
 
 
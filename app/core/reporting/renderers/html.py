@@ -73,14 +73,9 @@ def _render_section(section: ReportSection) -> list[str]:
         section_parts.append("<p class='empty'>Keine Inhalte in diesem Abschnitt.</p>")
     else:
         for block in section.blocks:
-            if isinstance(block, TextBlock):
-                section_parts.extend(_render_text_block(block))
-            elif isinstance(block, MetricsBlock):
-                section_parts.extend(_render_metrics_block(block))
-            elif isinstance(block, TableBlock):
-                section_parts.extend(_render_table_block(block))
-            elif isinstance(block, ImageBlock):
-                section_parts.extend(_render_image_block(block))
+            renderer = _BLOCK_RENDERERS.get(type(block))
+            if renderer is not None:
+                section_parts.extend(renderer(block))
 
     section_parts.append("</section>")
     return section_parts
@@ -151,11 +146,11 @@ def _render_table_block(block: TableBlock) -> list[str]:
 
     parts.append("<tbody>")
     if block.rows:
-        for row in block.rows:
-            parts.append("<tr>")
-            for column in block.columns:
-                parts.append(f"<td>{_format_table_cell(row, column)}</td>")
-            parts.append("</tr>")
+        columns = block.columns
+        parts.extend(
+            "<tr>" + "".join(f"<td>{_format_table_cell(row, column)}</td>" for column in columns) + "</tr>"
+            for row in block.rows
+        )
     else:
         parts.append(
             f"<tr><td class='empty' colspan='{len(block.columns)}'>Keine Tabellenzeilen verfügbar.</td></tr>"
@@ -202,6 +197,14 @@ def _render_image_block(block: ImageBlock) -> list[str]:
     return parts
 
 
+_BLOCK_RENDERERS = {
+    TextBlock: _render_text_block,
+    MetricsBlock: _render_metrics_block,
+    TableBlock: _render_table_block,
+    ImageBlock: _render_image_block,
+}
+
+
 def _metadata_item(label: str, value: str | None, fallback: str) -> str:
     return (
         "<div class='metadata-item'>"
@@ -288,11 +291,14 @@ def _format_datetime(value: object) -> str:
     return _safe_text(str(value) if value is not None else None, fallback="Unbekannt")
 
 
+_GERMAN_NUMBER_SEPARATORS = str.maketrans({",": ".", ".": ","})
+
+
 def _format_number_german(value: float, *, decimal_places: int) -> str:
     text = f"{value:,.{decimal_places}f}"
     if decimal_places > 0:
         text = text.rstrip("0").rstrip(".")
-    return text.replace(",", "§").replace(".", ",").replace("§", ".")
+    return text.translate(_GERMAN_NUMBER_SEPARATORS)
 
 
 def _escape_with_line_breaks(text: str) -> str:
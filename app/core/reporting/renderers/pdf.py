@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any
@@ -143,10 +144,12 @@ def _append_project_metadata(
         [Paragraph("<b>Erstellt am</b>", styles["label"]), Paragraph(created_at, styles["value"])],
     ]
 
+    label_style = styles["label"]
+    value_style = styles["value"]
     for key, value in sorted(document.metadata.additional_info.items()):
         metadata_rows.append([
-            Paragraph(f"<b>{_safe_text(key, 'Info')}</b>", styles["label"]),
-            Paragraph(_safe_text(value, "–"), styles["value"]),
+            Paragraph(f"<b>{_safe_text(key, 'Info')}</b>", label_style),
+            Paragraph(_safe_text(value, "–"), value_style),
         ])
 
     table = Table(metadata_rows, colWidths=[45 * mm, 125 * mm], hAlign="LEFT")
@@ -188,14 +191,16 @@ def _append_general_metrics(
         story.append(Spacer(1, 5 * mm))
         return
 
+    label_style = styles["label"]
+    value_style = styles["value"]
     metric_rows: list[list[Any]] = []
     for metric in metrics_block.metrics:
         label = metric.label or metric.key
         if metric.unit:
             label = f"{label} [{metric.unit}]"
         metric_rows.append([
-            Paragraph(_safe_text(label, metric.key), styles["label"]),
-            Paragraph(_format_metric_value(metric), styles["value"]),
+            Paragraph(_safe_text(label, metric.key), label_style),
+            Paragraph(_format_metric_value(metric), value_style),
         ])
 
     metrics_table = Table(metric_rows, colWidths=[95 * mm, 75 * mm], hAlign="LEFT")
@@ -229,19 +234,21 @@ def _append_schichtaufbau_dimensions(
         return
 
     compact_rows = _compact_dimension_rows(metrics_block.metrics)
+    label_style = styles["label"]
+    value_style = styles["value"]
     rows: list[list[Any]] = []
     if compact_rows:
         for label, value in compact_rows:
             rows.append([
-                Paragraph(_safe_text(label, "Maß"), styles["label"]),
-                Paragraph(_safe_text(value, "–"), styles["value"]),
+                Paragraph(_safe_text(label, "Maß"), label_style),
+                Paragraph(_safe_text(value, "–"), value_style),
             ])
     else:
         for metric in metrics_block.metrics:
             label = metric.label or metric.key
             rows.append([
-                Paragraph(_safe_text(label, metric.key), styles["label"]),
-                Paragraph(_format_metric_value(metric), styles["value"]),
+                Paragraph(_safe_text(label, metric.key), label_style),
+                Paragraph(_format_metric_value(metric), value_style),
             ])
 
     table = Table(rows, colWidths=[92 * mm, 78 * mm], hAlign="LEFT")
@@ -374,13 +381,7 @@ def _append_temperature_profile(
 
 
 def _find_metrics_block(document: ReportDocument) -> MetricsBlock | None:
-    for section in document.sections:
-        if section.id != "allgemeine-daten":
-            continue
-        for block in section.blocks:
-            if isinstance(block, MetricsBlock):
-                return block
-    return None
+    return _find_section_metrics(document, "allgemeine-daten")
 
 
 def _find_section_metrics(document: ReportDocument, section_id: str) -> MetricsBlock | None:
@@ -466,6 +467,24 @@ def _format_table_cell(row: TableRow, column: TableColumn) -> str:
     return str(value)
 
 
+def _format_column_cells(rows: list[TableRow], column: TableColumn) -> list[str]:
+    """Format all cells of one column, reusing the text of repeated values."""
+
+    formatted: dict[tuple[type, object], str] = {}
+    cells: list[str] = []
+    for row in rows:
+        value = row.cells.get(column.key)
+        try:
+            key = (type(value), value)
+            text = formatted.get(key)
+            if text is None:
+                text = formatted[key] = _format_table_cell(row, column)
+        except TypeError:
+            text = _format_table_cell(row, column)
+        cells.append(text)
+    return cells
+
+
 def _format_number(value: object, *, unit: str | None) -> str:
     if isinstance(value, bool):
         return "1" if value else "0"
@@ -484,7 +503,7 @@ def _build_header_logo(Image: Any, mm: Any) -> Any | None:
     logo_path = resolve_bundled_path("heatrix_logo_v3.png")
     if not logo_path.exists():
         return None
-    logo = Image(str(logo_path))
+    logo = Image(BytesIO(_header_logo_png(logo_path)))
     max_width = 34 * mm
     max_height = 13 * mm
     original_width = float(getattr(logo, "imageWidth", 0.0) or 0.0)
@@ -500,6 +519,24 @@ def _build_header_logo(Image: Any, mm: Any) -> Any | None:
     return logo
 
 
+# About 300 dpi at the 34 mm header width.
+_HEADER_LOGO_MAX_PIXELS = 400
+
+
+@lru_cache(maxsize=2)
+def _header_logo_png(logo_path: Path) -> bytes:
+    """Downscale the bundled logo once; ReportLab re-encodes the full bitmap on every build."""
+
+    from PIL import Image as PILImage
+
+    with PILImage.open(logo_path) as source:
+        logo = source.copy()
+    logo.thumbnail((_HEADER_LOGO_MAX_PIXELS, _HEADER_LOGO_MAX_PIXELS), PILImage.Resampling.LANCZOS)
+    buffer = BytesIO()
+    logo.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
 def _format_integer(value: object) -> str:
     if isinstance(value, bool):
         return "1" if value else "0"
@@ -508,7 +545,10 @@ def _format_integer(value: object) -> str:
     return str(value)
 
 
+@lru_cache(maxsize=1)
 def _build_styles(ParagraphStyle: Any, getSampleStyleSheet: Any, colors: Any, TA_CENTER: Any) -> dict[str, Any]:
+    """Build the paragraph styles once per process; callers must not modify them."""
+
     sample = getSampleStyleSheet()
     return {
         "title": ParagraphStyle(
@@ -556,18 +596,19 @@ def _build_report_table(
     include_unit_in_header: bool,
     emphasize_summary_row: bool = False,
 ) -> Any:
+    header_style = styles["table_header"]
     header = [
-        Paragraph(_column_header_markup(column, include_unit=include_unit_in_header), styles["table_header"])
+        Paragraph(_column_header_markup(column, include_unit=include_unit_in_header), header_style)
         for column in table_block.columns
     ]
+    column_cells = [_format_column_cells(table_block.rows, column) for column in table_block.columns]
     rows: list[list[Any]] = [header]
-    for row in table_block.rows:
-        rows.append([_format_table_cell(row, column) for column in table_block.columns])
+    rows.extend(list(cells) for cells in zip(*column_cells))
 
     summary_row_index = _detect_summary_row_index(table_block) if emphasize_summary_row else None
     table = Table(
         rows,
-        colWidths=_table_col_widths(table_block.columns, table_block.rows, mm),
+        colWidths=_table_col_widths(table_block.columns, column_cells, mm),
         hAlign="LEFT",
         repeatRows=1,
         splitByRow=1,
@@ -654,27 +695,26 @@ def _format_datetime(value: datetime | object) -> str:
     return "Unbekannt"
 
 
+_DIMENSION_ROW_GROUPS: tuple[tuple[str, str], ...] = (
+    ("given_outer_", "Gegebenes Außenmaß"),
+    ("given_inner_", "Gegebenes Innenmaß"),
+    ("calculated_inner_", "Berechnetes Innenmaß"),
+    ("calculated_outer_", "Berechnetes Außenmaß"),
+)
+
+
 def _compact_dimension_rows(metrics: list[MetricItem]) -> list[tuple[str, str]]:
     grouped: dict[str, dict[str, MetricItem]] = {}
     for metric in metrics:
         key = metric.key.strip().lower()
-        if key.startswith("given_outer_"):
-            grouped.setdefault("Gegebenes Außenmaß", {})[key.rsplit("_", 1)[-1]] = metric
-        elif key.startswith("given_inner_"):
-            grouped.setdefault("Gegebenes Innenmaß", {})[key.rsplit("_", 1)[-1]] = metric
-        elif key.startswith("calculated_inner_"):
-            grouped.setdefault("Berechnetes Innenmaß", {})[key.rsplit("_", 1)[-1]] = metric
-        elif key.startswith("calculated_outer_"):
-            grouped.setdefault("Berechnetes Außenmaß", {})[key.rsplit("_", 1)[-1]] = metric
+        for prefix, label in _DIMENSION_ROW_GROUPS:
+            if key.startswith(prefix):
+                grouped.setdefault(label, {})[key.rsplit("_", 1)[-1]] = metric
+                break
 
     rows: list[tuple[str, str]] = []
-    for label in (
-        "Gegebenes Außenmaß",
-        "Gegebenes Innenmaß",
-        "Berechnetes Innenmaß",
-        "Berechnetes Außenmaß",
-    ):
-        axis_metrics = grouped.get(label, {})
+    for _prefix, label in _DIMENSION_ROW_GROUPS:
+        axis_metrics = grouped.get(label)
         if not axis_metrics:
             continue
         values = [_format_dimension_axis_value(axis_metrics.get(axis)) for axis in ("l", "b", "h")]
@@ -691,14 +731,17 @@ def _format_dimension_axis_value(metric: MetricItem | None) -> str:
     return str(value)
 
 
+_GERMAN_NUMBER_SEPARATORS = str.maketrans({",": ".", ".": ","})
+
+
 def _format_number_german(value: float, *, decimal_places: int) -> str:
     text = f"{value:,.{decimal_places}f}"
     if decimal_places > 0:
         text = text.rstrip("0").rstrip(".")
-    return text.replace(",", "§").replace(".", ",").replace("§", ".")
+    return text.translate(_GERMAN_NUMBER_SEPARATORS)
 
 
-def _table_col_widths(columns: list[TableColumn], rows: list[TableRow], mm: Any) -> list[float]:
+def _table_col_widths(columns: list[TableColumn], column_cells: list[list[str]], mm: Any) -> list[float]:
     count = len(columns)
     if count == 0:
         return []
@@ -708,7 +751,7 @@ def _table_col_widths(columns: list[TableColumn], rows: list[TableRow], mm: Any)
     if reserved_min >= total_width:
         return [total_width / count] * count
 
-    column_weights = [_column_width_weight(column, rows) for column in columns]
+    column_weights = [_column_width_weight(column, cells) for column, cells in zip(columns, column_cells)]
     weight_sum = sum(column_weights)
     if weight_sum <= 0:
         return [total_width / count] * count
@@ -718,11 +761,11 @@ def _table_col_widths(columns: list[TableColumn], rows: list[TableRow], mm: Any)
     return _cap_column_widths(widths, total_width)
 
 
-def _column_width_weight(column: TableColumn, rows: list[TableRow]) -> float:
+def _column_width_weight(column: TableColumn, cells: list[str]) -> float:
     label = _safe_text(column.label, column.key)
     unit = (column.unit or "").strip()
     header_len = max(len(label), len(unit))
-    content_lengths = [len(_format_table_cell(row, column)) for row in rows[:200]]
+    content_lengths = [len(text) for text in cells[:200]]
     if content_lengths:
         content_lengths.sort()
         typical_content_len = content_lengths[int((len(content_lengths) - 1) * 0.75)]
@@ -1,6 +1,7 @@
 """Gemeinsame Pfad-Helfer für Quellcode- und PyInstaller-Laufzeit."""
 from __future__ import annotations
 
+from functools import lru_cache
 import os
 from pathlib import Path
 import sys
@@ -12,8 +13,9 @@ def is_frozen() -> bool:
     return bool(getattr(sys, "frozen", False))
 
 
+@lru_cache(maxsize=1)
 def bundle_root() -> Path:
-    """Basisverzeichnis für gebündelte Ressourcen."""
+    """Basisverzeichnis für gebündelte Ressourcen (einmalig aufgelöst)."""
 
     if hasattr(sys, "_MEIPASS"):
         return Path(sys._MEIPASS)
@@ -1,13 +1,14 @@
 """Qt UI tab for robust management of insulation families and variants."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
 import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSignalBlocker, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSignalBlocker, QSortFilterProxyModel, Qt, QTimer
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QFileDialog,
@@ -40,7 +41,7 @@ from app.core.isolierungen_db.logic import (
     update_family,
     update_variant,
 )
-from app.core.isolierungen_db.services import parse_optional_float, parse_required_float
+from app.core.isolierungen_db.services import parse_float_list, parse_optional_float, parse_required_float
 from app.core.isolierungen_exchange.export_service import (
     EXPORT_FILE_SUFFIX,
     build_insulation_exchange_payload,
@@ -61,18 +62,78 @@ _OUTCOME_LABELS = {
     "rolled_back": "Wegen Rollback nicht übernommen",
 }
 
+_FILTER_DEBOUNCE_MS = 150
+_STATUS_MESSAGE_MS = 3000
+
+
+@lru_cache(maxsize=64)
+def _plot_x_range(end_temp: int) -> np.ndarray:
+    """Temperaturachse 20 °C … ``end_temp`` (schreibgeschützt, da geteilt)."""
+
+    values = np.arange(20, max(20, end_temp) + 1, dtype=np.float64)
+    values.setflags(write=False)
+    return values
+
+
+@lru_cache(maxsize=64)
+def _plot_k_curve(temps: tuple[float, ...], ks: tuple[float, ...], end_temp: int) -> np.ndarray:
+    """Interpolierte k-Kurve je Messreihe; erneutes Auswählen einer Familie rechnet nicht neu."""
+
+    values = interpolate_k(
+        np.asarray(temps, dtype=np.float64),
+        np.asarray(ks, dtype=np.float64),
+        x_range=_plot_x_range(end_temp),
+    )
+    values.setflags(write=False)
+    return values
+
+
+@lru_cache(maxsize=128)
+def _format_float_list(values: tuple[float, ...]) -> str:
+    return ", ".join(map(str, values))
+
 
 class DictTableModel(QAbstractTableModel):
     def __init__(self, columns: list[tuple[str, str]], parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._columns = columns
         self._rows: list[dict] = []
+        self._display_rows: list[tuple[str, ...]] = []
+        self._row_by_id: dict[int, int] | None = None
 
     def set_rows(self, rows: list[dict]) -> None:
+        display_rows = [self._display_texts(row) for row in rows]
+        if rows and len(rows) == len(self._rows) and all(
+            new.get("id") == old.get("id") for new, old in zip(rows, self._rows)
+        ):
+            # Gleiche Datensätze in gleicher Reihenfolge: nur geänderte Zeilen melden,
+            # damit Auswahl, Sortierung und Scroll-Position erhalten bleiben.
+            changed = [row for row, (new, old) in enumerate(zip(display_rows, self._display_rows)) if new != old]
+            self._rows = rows
+            self._display_rows = display_rows
+            if changed:
+                self.dataChanged.emit(
+                    self.index(changed[0], 0),
+                    self.index(changed[-1], len(self._columns) - 1),
+                    [Qt.DisplayRole, Qt.EditRole],
+                )
+            return
         self.beginResetModel()
         self._rows = rows
+        self._display_rows = display_rows
+        self._row_by_id = None
         self.endResetModel()
 
+    def _display_texts(self, row: dict) -> tuple[str, ...]:
+        texts = []
+        for key, _label in self._columns:
+            value = row.get(key)
+            if value is None:
+                texts.append("—" if key == "max_temp" else "")
+            else:
+                texts.append(str(value))
+        return tuple(texts)
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._rows)
 
@@ -82,24 +143,24 @@ class DictTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
             return None
-        key = self._columns[index.column()][0]
-        value = self._rows[index.row()].get(key)
-        if value is None:
-            return "—" if key == "max_temp" else ""
-        return str(value)
+        return self._display_rows[index.row()][index.column()]
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
-        if role != Qt.DisplayRole:
+        # Die vertikalen Header sind in beiden Tabellen ausgeblendet.
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
             return None
-        if orientation == Qt.Horizontal:
-            return self._columns[section][1]
-        return str(section + 1)
+        return self._columns[section][1]
 
     def get_row(self, row: int) -> dict | None:
         if 0 <= row < len(self._rows):
             return self._rows[row]
         return None
 
+    def row_for_id(self, row_id: int) -> int | None:
+        if self._row_by_id is None:
+            self._row_by_id = {int(row["id"]): index for index, row in enumerate(self._rows)}
+        return self._row_by_id.get(row_id)
+
 
 class IsolierungenDbTab:
     def __init__(self, tab_widget: QTabWidget, title: str = "Isolierungen DB") -> None:
@@ -107,9 +168,15 @@ class IsolierungenDbTab:
         self._selected_family_id: int | None = None
         self._selected_variant_id: int | None = None
         self._listener_registered = False
-        self._material_change_handler = self.refresh_table
+        self._family_cache: dict[int, dict] = {}
+        self._material_change_handler = self._schedule_refresh
 
         self.widget = QWidget()
+        # Einmaliger 0-ms-Timer: wiederholtes start() fasst Änderungsschübe zu einem Refresh zusammen.
+        self._refresh_timer = QTimer(self.widget)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._run_scheduled_refresh)
         root_layout = make_root_vbox(self.widget)
         root_layout.addWidget(create_page_header("Isolierungen DB", show_logo=True, parent=self.widget))
 
@@ -121,6 +188,13 @@ class IsolierungenDbTab:
         self._content_layout.setContentsMargins(0, 0, 0, 0)
         scroll_area.setWidget(content)
         root_layout.addWidget(scroll_area, 1)
+        self._status_label = QLabel("")
+        self._status_label.setWordWrap(True)
+        root_layout.addWidget(self._status_label)
+        self._status_timer = QTimer(self.widget)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_STATUS_MESSAGE_MS)
+        self._status_timer.timeout.connect(self._status_label.clear)
 
         tables_row = make_hbox()
         self._family_section = self._build_family_section()
@@ -171,11 +245,7 @@ class IsolierungenDbTab:
                 ("variant_count", "Varianten"),
             ]
         )
-        self._family_proxy = QSortFilterProxyModel(self.widget)
-        self._family_proxy.setSourceModel(self._family_model)
-        self._family_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self._family_proxy.setFilterKeyColumn(0)
-        self._family_proxy.setDynamicSortFilter(True)
+        self._family_proxy = self._make_proxy(self._family_model)
 
         self._family_table = QTableView()
         self._family_table.setModel(self._family_proxy)
@@ -193,7 +263,7 @@ class IsolierungenDbTab:
         section.setMinimumHeight(340)
         section.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        self._family_search.textChanged.connect(self._family_proxy.setFilterFixedString)
+        self._connect_debounced_filter(self._family_search, self._family_proxy)
         self._family_table.selectionModel().selectionChanged.connect(self.on_family_select)
         self._new_family_button.clicked.connect(self.new_family)
         self._delete_family_button.clicked.connect(self.delete_family)
@@ -226,11 +296,7 @@ class IsolierungenDbTab:
                 ("price", "Preis [€]"),
             ]
         )
-        self._variant_proxy = QSortFilterProxyModel(self.widget)
-        self._variant_proxy.setSourceModel(self._variant_model)
-        self._variant_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self._variant_proxy.setFilterKeyColumn(0)
-        self._variant_proxy.setDynamicSortFilter(True)
+        self._variant_proxy = self._make_proxy(self._variant_model)
 
         self._variant_table = QTableView()
         self._variant_table.setModel(self._variant_proxy)
@@ -248,7 +314,7 @@ class IsolierungenDbTab:
         section.setMinimumHeight(340)
         section.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        self._variant_search.textChanged.connect(self._variant_proxy.setFilterFixedString)
+        self._connect_debounced_filter(self._variant_search, self._variant_proxy)
         self._variant_table.selectionModel().selectionChanged.connect(self.on_variant_select)
         self._new_variant_button.clicked.connect(self.new_variant)
         self._delete_variant_button.clicked.connect(self.delete_variant)
@@ -314,11 +380,45 @@ class IsolierungenDbTab:
     def _build_plot_section(self) -> QGroupBox:
         self._plot_section = QGroupBox("Interpolierte Wärmeleitfähigkeit")
         self._plot_layout = QVBoxLayout(self._plot_section)
+        self._plot_figure = Figure(figsize=(7, 3.2), dpi=100)
+        self._plot_canvas = FigureCanvasQTAgg(self._plot_figure)
+        self._plot_canvas.hide()
+        self._plot_layout.addWidget(self._plot_canvas)
         self._plot_section.setMinimumHeight(280)
         self._plot_section.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         return self._plot_section
 
+    def _schedule_refresh(self) -> None:
+        """Fasst mehrere Materialänderungen zu einem Refresh im nächsten Event-Loop-Durchlauf zusammen."""
+
+        self._family_cache.clear()
+        self._refresh_timer.start()
+
+    def _run_scheduled_refresh(self) -> None:
+        if self._listener_registered:
+            self.refresh_table()
+
+    def _make_proxy(self, model: DictTableModel) -> QSortFilterProxyModel:
+        proxy = QSortFilterProxyModel(self.widget)
+        proxy.setSourceModel(model)
+        proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        proxy.setFilterKeyColumn(0)
+        proxy.setDynamicSortFilter(True)
+        return proxy
+
+    @staticmethod
+    def _connect_debounced_filter(search_input: QLineEdit, proxy: QSortFilterProxyModel) -> None:
+        """Filtert erst nach einer kurzen Tipp-Pause statt bei jedem Tastendruck."""
+
+        timer = QTimer(search_input)
+        timer.setSingleShot(True)
+        timer.setInterval(_FILTER_DEBOUNCE_MS)
+        timer.timeout.connect(lambda: proxy.setFilterFixedString(search_input.text()))
+        search_input.textChanged.connect(lambda _text: timer.start())
+
     def refresh_table(self, preserve_selection: bool = True) -> None:
+        self._refresh_timer.stop()
+        self._family_cache.clear()
         selected_family_id = self._selected_family_id if preserve_selection else None
         selected_variant_id = self._selected_variant_id if preserve_selection else None
         family_scroll = self._family_table.verticalScrollBar().value()
@@ -340,36 +440,47 @@ class IsolierungenDbTab:
             self._select_variant_id(selected_variant_id)
 
     def _select_family_id(self, family_id: int) -> None:
-        for row in range(self._family_model.rowCount()):
-            source = self._family_model.get_row(row)
-            if source and int(source["id"]) == family_id:
-                source_index = self._family_model.index(row, 0)
-                proxy_index = self._family_proxy.mapFromSource(source_index)
-                if proxy_index.isValid():
-                    self._family_table.selectRow(proxy_index.row())
-                self._selected_family_id = family_id
-                self._load_family(family_id)
-                return
+        row = self._family_model.row_for_id(family_id)
+        if row is None:
+            return
+        proxy_index = self._family_proxy.mapFromSource(self._family_model.index(row, 0))
+        if proxy_index.isValid():
+            # _load_family folgt direkt; on_family_select würde die Familie doppelt laden.
+            with QSignalBlocker(self._family_table.selectionModel()):
+                self._family_table.selectRow(proxy_index.row())
+        self._selected_family_id = family_id
+        self._load_family(family_id)
 
     def _select_variant_id(self, variant_id: int) -> None:
-        for row in range(self._variant_model.rowCount()):
-            source = self._variant_model.get_row(row)
-            if source and int(source["id"]) == variant_id:
-                source_index = self._variant_model.index(row, 0)
-                proxy_index = self._variant_proxy.mapFromSource(source_index)
-                if proxy_index.isValid():
-                    self._variant_table.selectRow(proxy_index.row())
-                return
+        row = self._variant_model.row_for_id(variant_id)
+        if row is None:
+            return
+        proxy_index = self._variant_proxy.mapFromSource(self._variant_model.index(row, 0))
+        if proxy_index.isValid():
+            self._variant_table.selectRow(proxy_index.row())
+
+    def _get_family(self, family_id: int) -> dict:
+        """Liefert die Familie aus dem Cache; jede Materialänderung leert ihn."""
+
+        data = self._family_cache.get(family_id)
+        if data is None:
+            data = get_family_by_id(family_id)
+            self._family_cache[family_id] = data
+        return data
 
     def _load_family(self, family_id: int) -> None:
-        data = get_family_by_id(family_id)
+        self._clear_status()
+        data = self._get_family(family_id)
         self._family_name_input.setText(data["name"])
         self._family_class_temp_input.setText(str(data["classification_temp"]))
         self._family_max_temp_input.setText("" if data.get("max_temp") is None else str(data["max_temp"]))
         self._family_density_input.setText(str(data["density"]))
-        self._family_temps_input.setText(", ".join(map(str, data.get("temps", []))))
-        self._family_ks_input.setText(", ".join(map(str, data.get("ks", []))))
+        self._family_temps_input.setText(_format_float_list(tuple(data.get("temps", []))))
+        self._family_ks_input.setText(_format_float_list(tuple(data.get("ks", []))))
         self._variant_model.set_rows(data.get("variants", []))
+        with QSignalBlocker(self._variant_table.selectionModel()):
+            self._variant_table.setCurrentIndex(QModelIndex())
+            self._variant_table.clearSelection()
         self._selected_variant_id = None
         self._clear_variant_form()
         self.update_plot(data.get("temps", []), data.get("ks", []), data.get("classification_temp"))
@@ -408,17 +519,30 @@ class IsolierungenDbTab:
             class_temp = parse_required_float(self._family_class_temp_input.text(), "Klass.-Temp")
             max_temp = parse_optional_float(self._family_max_temp_input.text())
             density = parse_required_float(self._family_density_input.text(), "Dichte")
-            temps = self._parse_float_list(self._family_temps_input.text())
-            ks = self._parse_float_list(self._family_ks_input.text())
+            temps = parse_float_list(self._family_temps_input.text())
+            ks = parse_float_list(self._family_ks_input.text())
             selected_family_id = self._get_selected_family_id()
             if selected_family_id is None:
                 self._selected_family_id = create_family(name, class_temp, max_temp, density, temps, ks)
+                self.refresh_table()
             else:
                 self._selected_family_id = selected_family_id
+                form_values = {
+                    "name": name,
+                    "classification_temp": class_temp,
+                    "max_temp": max_temp,
+                    "density": density,
+                    "temps": temps,
+                    "ks": ks,
+                }
+                if self._row_matches(self._family_cache.get(selected_family_id), form_values):
+                    self._show_status("Keine Änderungen an der Familie.")
+                    return
                 update_family(selected_family_id, name, class_temp, max_temp, density, temps, ks)
-            self.refresh_table()
-            QMessageBox.information(self.widget, "Gespeichert", "Familie wurde gespeichert.")
+                self.refresh_table()
+            self._show_status("Familie wurde gespeichert.")
         except Exception as exc:
+            self._clear_status()
             QMessageBox.critical(self.widget, "Fehler", str(exc))
 
     def save_variant(self) -> None:
@@ -435,13 +559,29 @@ class IsolierungenDbTab:
                 self._selected_variant_id = create_variant(
                     self._selected_family_id, name, thickness, length, width, price
                 )
+                self.refresh_table()
             else:
+                form_values = {"name": name, "thickness": thickness, "length": length, "width": width, "price": price}
+                row = self._variant_model.row_for_id(self._selected_variant_id)
+                current = None if row is None else self._variant_model.get_row(row)
+                if self._row_matches(current, form_values):
+                    self._show_status("Keine Änderungen an der Variante.")
+                    return
                 update_variant(self._selected_variant_id, name, thickness, length, width, price)
-            self.refresh_table()
-            QMessageBox.information(self.widget, "Gespeichert", "Variante wurde gespeichert.")
+                self.refresh_table()
+            self._show_status("Variante wurde gespeichert.")
         except Exception as exc:
+            self._clear_status()
             QMessageBox.critical(self.widget, "Fehler", str(exc))
 
+    def _show_status(self, text: str) -> None:
+        self._status_label.setText(text)
+        self._status_timer.start()
+
+    def _clear_status(self) -> None:
+        self._status_timer.stop()
+        self._status_label.clear()
+
     def export_selected_family(self) -> None:
         family_id = self._get_selected_family_id()
         if family_id is None:
@@ -607,6 +747,7 @@ class IsolierungenDbTab:
             QSignalBlocker(self._family_table.selectionModel()),
             QSignalBlocker(self._variant_table.selectionModel()),
         ]
+        self._clear_status()
         self._selected_family_id = None
         self._selected_variant_id = None
         self._family_table.setCurrentIndex(QModelIndex())
@@ -621,6 +762,7 @@ class IsolierungenDbTab:
 
     def new_variant(self) -> None:
         blockers = [QSignalBlocker(self._variant_table.selectionModel())]
+        self._clear_status()
         self._selected_variant_id = None
         self._variant_table.setCurrentIndex(QModelIndex())
         self._variant_table.clearSelection()
@@ -628,14 +770,16 @@ class IsolierungenDbTab:
         del blockers
 
     def update_plot(self, temps: Sequence[float], ks: Sequence[float], class_temp: float | None) -> None:
-        self._clear_layout(self._plot_layout)
         if not temps or not ks:
+            self._plot_canvas.hide()
             return
         max_temp = class_temp if class_temp is not None else max(temps)
-        x_values = [float(value) for value in range(20, max(20, int(max_temp)) + 1)]
-        k_values = interpolate_k(list(temps), list(ks), x_range=np.array(x_values))
+        end_temp = int(max_temp)
+        x_values = _plot_x_range(end_temp)
+        k_values = _plot_k_curve(tuple(temps), tuple(ks), end_temp)
 
-        figure = Figure(figsize=(7, 3.2), dpi=100)
+        figure = self._plot_figure
+        figure.clear()
         axis = figure.add_subplot(111)
         axis.plot(x_values, k_values, linewidth=2, label="Interpoliert")
         axis.scatter(temps, ks, color="red", zorder=5, label="Messpunkte")
@@ -645,8 +789,8 @@ class IsolierungenDbTab:
         axis.legend()
         axis.grid(True, linestyle="--", alpha=0.6)
         figure.tight_layout()
-
-        self._plot_layout.addWidget(FigureCanvasQTAgg(figure))
+        self._plot_canvas.show()
+        self._plot_canvas.draw_idle()
 
     def _clear_family_form(self) -> None:
         self._family_name_input.clear()
@@ -672,12 +816,12 @@ class IsolierungenDbTab:
         return app_version_text or None
 
     @staticmethod
-    def _parse_float_list(value: str) -> list[float]:
-        cleaned = value.strip()
-        if not cleaned:
-            return []
-        separator = ";" if ";" in cleaned else ","
-        return [float(part.strip().replace(",", ".")) for part in cleaned.split(separator) if part.strip()]
+    def _row_matches(row: dict | None, values: dict) -> bool:
+        """True, wenn der geladene Datensatz bereits den Formularwerten entspricht."""
+
+        if row is None:
+            return False
+        return all(row.get(key) == value for key, value in values.items())
 
     def _get_selected_family_id(self) -> int | None:
         selected_rows = self._family_table.selectionModel().selectedRows()
@@ -689,14 +833,6 @@ class IsolierungenDbTab:
             return None
         return int(row["id"])
 
-    @staticmethod
-    def _clear_layout(layout: QVBoxLayout) -> None:
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget() if item else None
-            if widget:
-                widget.deleteLater()
-
     def _on_widget_destroyed(self, _obj: object | None = None) -> None:
         if self._listener_registered:
             unregister_material_change_listener(self._material_change_handler)
@@ -1,9 +1,11 @@
 """Global Qt tab for PDF report previews and export."""
 from __future__ import annotations
 
+import shutil
 import tempfile
 from collections.abc import Mapping
 from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtPdf import QPdfDocument
@@ -91,7 +93,7 @@ class ReportTab:
         layout.addLayout(metadata_form)
 
         refresh_button = QPushButton("Vorschau aktualisieren")
-        refresh_button.clicked.connect(self.refresh_preview)
+        refresh_button.clicked.connect(self._on_refresh_clicked)
 
         export_pdf_button = QPushButton("PDF exportieren")
         export_pdf_button.clicked.connect(self.export_pdf)
@@ -108,9 +110,12 @@ class ReportTab:
         self._preview_pdf_view.setPageMode(QPdfView.PageMode.MultiPage)
         layout.addWidget(self._preview_pdf_view, stretch=1)
 
-    def refresh_preview(self) -> None:
+    def refresh_preview(self, *, force: bool = False) -> None:
         if self._preview_pdf_document is None:
             return
+        # Unsichtbare Vorschau nicht rendern; beim Öffnen des Tabs wird neu angestoßen.
+        if not self.widget.isVisible():
+            return
 
         self._cleanup_stale_preview_paths()
 
@@ -118,6 +123,14 @@ class ReportTab:
         if report_document is None:
             return
 
+        if (
+            not force
+            and self._preview_pdf_path is not None
+            and _same_report_content(report_document, self._last_preview_document)
+        ):
+            self._set_status("Status: Vorschau ist aktuell (keine Änderungen).")
+            return
+
         previous_preview_path = self._preview_pdf_path
         self._release_preview_document()
 
@@ -142,6 +155,10 @@ class ReportTab:
         self._cleanup_stale_preview_paths()
         self._set_status("Status: Vorschau erfolgreich aktualisiert.")
 
+    def _on_refresh_clicked(self) -> None:
+        # Ausdrücklich angeforderte Vorschau immer neu erzeugen (u. a. mit aktuellem Erstellungsdatum).
+        self.refresh_preview(force=True)
+
     def export_pdf(self) -> None:
         report_document = self._resolve_export_document()
         if report_document is None:
@@ -162,7 +179,7 @@ class ReportTab:
             selected_path = f"{selected_path}.pdf"
 
         try:
-            saved_path = render_report_pdf(report_document, selected_path)
+            saved_path = self._write_export_pdf(report_document, Path(selected_path))
         except Exception as exc:
             self._set_status(f"Status: PDF-Export fehlgeschlagen ({exc}).")
             return
@@ -174,18 +191,23 @@ class ReportTab:
             return replace(self._last_preview_document)
         return self._build_report_document()
 
+    def _write_export_pdf(self, report_document: ReportDocument, target: Path) -> Path:
+        # Die Vorschau-PDF wurde aus demselben Dokument erzeugt und kann direkt kopiert werden.
+        preview_path = self._preview_pdf_path
+        if preview_path is not None and report_document == self._last_preview_document and preview_path.is_file():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(preview_path, target)
+            return target
+        return render_report_pdf(report_document, target)
+
     def _build_report_document(self) -> ReportDocument | None:
         try:
-            states = self._plugin_manager.export_all_states()
+            # Der Bericht liest nur den Isolierung-State; andere Plugins werden nicht exportiert.
+            isolierung_state = self._plugin_manager.export_state("isolierung")
         except Exception as exc:
             self._set_status(f"Status: Fehler beim Export der Plugin-States ({exc}).")
             return None
 
-        if not states:
-            self._set_status("Status: Keine Plugin-States verfügbar.")
-            return None
-
-        isolierung_state = states.get("isolierung")
         if not isinstance(isolierung_state, Mapping):
             self._set_status("Status: Isolierung-State fehlt oder hat ein ungültiges Format.")
             return None
@@ -280,6 +302,27 @@ class ReportTab:
         return value or None
 
 
+def _same_report_content(document: ReportDocument, previous: ReportDocument | None) -> bool:
+    """Vergleicht zwei Berichte ohne die Uhrzeit der Erstellung.
+
+    Das gedruckte Erstellungsdatum muss übereinstimmen, sonst wird neu gerendert.
+    """
+
+    if previous is None:
+        return False
+    if _local_date(document.metadata.created_at) != _local_date(previous.metadata.created_at):
+        return False
+    comparable = replace(
+        document,
+        metadata=replace(document.metadata, created_at=previous.metadata.created_at),
+    )
+    return comparable == previous
+
+
+def _local_date(value: object) -> object:
+    return value.astimezone().date() if isinstance(value, datetime) else value
+
+
 def _sanitize_file_name(name: str) -> str:
     forbidden = '<>:"/\\|?*'
     cleaned = "".join("_" if ch in forbidden else ch for ch in (name or "bericht.pdf"))
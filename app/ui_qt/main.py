@@ -33,7 +33,6 @@ def main() -> int:
     IsolierungenDbTab(tab_widget, title="Isolierungen DB")
 
     plugin_manager.load_plugins()
-    report_tab.refresh_preview()
     projects_tab.on_plugins_loaded()
 
     def _refresh_report_on_tab_change(index: int) -> None:
@@ -45,6 +44,9 @@ def main() -> int:
     window.setWindowTitle("Heatrix Berechnungstools")
     window.resize(1280, 840)
     window.showMaximized()
+    # Die Vorschau wird erst gerendert, wenn der Bericht-Tab sichtbar ist.
+    if tab_widget.currentWidget() is report_tab.widget:
+        report_tab.refresh_preview()
     return app.exec()
 
 
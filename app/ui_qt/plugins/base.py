@@ -9,6 +9,8 @@ from PySide6.QtCore import QObject as _QtQObject
 from PySide6.QtWidgets import QMainWindow, QTabWidget
 
 _QT_OBJECT_TYPES: tuple[type[object], ...] = (_QtQObject,)
+_JSON_SCALAR_TYPES: tuple[type[object], ...] = (str, int, float, bool)
+_STATE_SECTIONS = frozenset({"inputs", "results", "ui"})
 
 
 @dataclass
@@ -53,11 +55,14 @@ class QtPlugin(ABC):
         """
         if not isinstance(state, dict):
             raise TypeError("State must be a dictionary.")
-        allowed_sections = {"inputs", "results", "ui"}
-        normalized: dict[str, Any] = {section: {} for section in allowed_sections}
+        if state.keys() == _STATE_SECTIONS:
+            # Already normalized: validate the sections without rebuilding the mapping.
+            normalized: dict[str, Any] = dict(state)
+        else:
+            normalized = {section: {} for section in _STATE_SECTIONS}
         legacy_sections: dict[str, Any] = {}
         for key, value in state.items():
-            if key not in allowed_sections:
+            if key not in _STATE_SECTIONS:
                 self._validate_json_value(value, path=key)
                 legacy_sections[key] = value
                 continue
@@ -74,21 +79,40 @@ class QtPlugin(ABC):
         return normalized
 
     def _validate_json_value(self, value: Any, *, path: str) -> None:
-        if _QT_OBJECT_TYPES and isinstance(value, _QT_OBJECT_TYPES):
-            raise TypeError(f"Qt object detected at {path}.")
-        if isinstance(value, dict):
-            for key, item in value.items():
-                if not isinstance(key, str):
-                    raise TypeError(f"Non-string dict key at {path}: {key!r}.")
-                self._validate_json_value(item, path=f"{path}.{key}")
-            return
-        if isinstance(value, list):
-            for index, item in enumerate(value):
-                self._validate_json_value(item, path=f"{path}[{index}]")
-            return
-        if value is None or isinstance(value, (str, int, float, bool)):
-            return
-        raise TypeError(f"Unsupported value at {path}: {type(value).__name__}.")
+        # Explicit stack instead of recursion. Children are pushed in reverse so they are popped in
+        # the same depth-first order as before and the first invalid value is the one reported.
+        # Plain scalars are skipped before being pushed, and error paths are only built from the
+        # (parent, key) chain when a value is rejected.
+        check_qt = bool(_QT_OBJECT_TYPES)
+        stack: list[tuple[Any, tuple[Any, str | int] | None]] = [(value, None)]
+        while stack:
+            current, location = stack.pop()
+            if type(current) is _NonStringKey:
+                raise TypeError(f"Non-string dict key at {_format_json_path(path, location)}: {current.key!r}.")
+            if check_qt and isinstance(current, _QT_OBJECT_TYPES):
+                raise TypeError(f"Qt object detected at {_format_json_path(path, location)}.")
+            if isinstance(current, dict):
+                children: list[tuple[Any, tuple[Any, str | int] | None]] = []
+                for key, item in current.items():
+                    if not isinstance(key, str):
+                        # Reported only after the preceding siblings have been validated.
+                        children.append((_NonStringKey(key), location))
+                        break
+                    if item is None or type(item) in _JSON_SCALAR_TYPES:
+                        continue
+                    children.append((item, (location, key)))
+                stack.extend(reversed(children))
+                continue
+            if isinstance(current, list):
+                for index in range(len(current) - 1, -1, -1):
+                    item = current[index]
+                    if item is None or type(item) in _JSON_SCALAR_TYPES:
+                        continue
+                    stack.append((item, (location, index)))
+                continue
+            if current is None or isinstance(current, _JSON_SCALAR_TYPES):
+                continue
+            raise TypeError(f"Unsupported value at {_format_json_path(path, location)}: {type(current).__name__}.")
 
     def import_state(self, state: dict[str, Any]) -> None:
         """Restore plugin state following the {"inputs": ..., "results": ..., "ui": ...} convention.
@@ -104,3 +128,20 @@ class QtPlugin(ABC):
 
     def refresh_view(self) -> None:
         """Hook to synchronise UI elements with the current internal state."""
+
+
+class _NonStringKey:
+    """Stack marker for a rejected dict key in ``QtPlugin._validate_json_value``."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: object) -> None:
+        self.key = key
+
+
+def _format_json_path(root: str, location: tuple[Any, str | int] | None) -> str:
+    parts: list[str] = []
+    while location is not None:
+        location, key = location
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return root + "".join(reversed(parts))
@@ -19,8 +19,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from app.ui_qt.ui_helpers import create_page_layout, make_grid, make_hbox
+from app.ui_qt.ui_helpers import create_page_layout, make_grid, make_hbox, suspended_updates
 
+_NUMERIC_TYPES: tuple[type[object], ...] = (int, float)
+_RESULT_STATUSES = frozenset({"ok", "error"})
 
 
 class ElektrikQtPlugin(QtPlugin):
@@ -117,6 +119,7 @@ class ElektrikQtPlugin(QtPlugin):
 
         single_button.clicked.connect(self._calculate_single_phase)
         three_button.clicked.connect(self._calculate_three_phase)
+        tab_widget.currentChanged.connect(self._on_tab_changed)
 
         self.widget = container
         self._single_voltage_input = single_voltage_input
@@ -175,7 +178,7 @@ class ElektrikQtPlugin(QtPlugin):
         self._set_label_text(self._three_result_label, self._three_result_text)
 
     def export_state(self) -> dict[str, Any]:
-        state = {
+        state: dict[str, Any] = {
             "inputs": {
                 "single_voltage": self._resolve_input_value(
                     self._single_voltage_input, self._single_voltage_value
@@ -206,7 +209,9 @@ class ElektrikQtPlugin(QtPlugin):
                 "active_tab": self._get_active_tab_index(),
             },
         }
-        return self.validate_state(state)
+        # Alle Werte stammen aus typisierten Attributen (str, float/None, int); eine erneute
+        # JSON-Prüfung ist nur beim Import fremder Daten nötig.
+        return state
 
     def import_state(self, state: dict[str, Any]) -> None:
         super().import_state(state)
@@ -252,24 +257,19 @@ class ElektrikQtPlugin(QtPlugin):
                 self._active_tab_index = active_tab
 
     def refresh_view(self) -> None:
-        self._set_input_text(self._single_voltage_input, self._single_voltage_value)
-        self._set_input_text(self._single_current_input, self._single_current_value)
-        self._set_input_text(self._three_voltage_input, self._three_voltage_value)
-        self._set_input_text(self._three_current_input, self._three_current_value)
-        self._single_result_text = self._format_result_text(
-            self._single_result_value,
-            self._single_result_status,
-            self._single_result_message,
-        )
-        self._three_result_text = self._format_result_text(
-            self._three_result_value,
-            self._three_result_status,
-            self._three_result_message,
-        )
-        self._set_label_text(self._single_result_label, self._single_result_text)
-        self._set_label_text(self._three_result_label, self._three_result_text)
-        if self._tab_widget is not None:
-            self._tab_widget.setCurrentIndex(self._active_tab_index)
+        if self.widget is None:
+            return
+        with suspended_updates(self.widget):
+            self._set_input_text(self._single_voltage_input, self._single_voltage_value)
+            self._set_input_text(self._single_current_input, self._single_current_value)
+            self._set_input_text(self._three_voltage_input, self._three_voltage_value)
+            self._set_input_text(self._three_current_input, self._three_current_value)
+            self._set_label_text(self._single_result_label, self._single_result_text)
+            self._set_label_text(self._three_result_label, self._three_result_text)
+            if self._tab_widget is not None:
+                self._tab_widget.setCurrentIndex(self._active_tab_index)
+                # Ungültige Indizes ignoriert Qt ohne Signal; den tatsächlichen Tab übernehmen.
+                self._active_tab_index = self._tab_widget.currentIndex()
 
     @staticmethod
     def _get_input_text(widget: object | None) -> str:
@@ -279,7 +279,7 @@ class ElektrikQtPlugin(QtPlugin):
 
     @staticmethod
     def _set_input_text(widget: object | None, value: str) -> None:
-        if widget is None:
+        if widget is None or widget.text() == value:
             return
         widget.setText(value)
 
@@ -291,7 +291,7 @@ class ElektrikQtPlugin(QtPlugin):
 
     @staticmethod
     def _set_label_text(widget: object | None, value: str) -> None:
-        if widget is None:
+        if widget is None or widget.text() == value:
             return
         widget.setText(value)
 
@@ -330,10 +330,10 @@ class ElektrikQtPlugin(QtPlugin):
         if not isinstance(entry, dict):
             return None, "error", ""
         value = entry.get("value")
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, _NUMERIC_TYPES):
             value = None
         status = entry.get("status")
-        if status not in {"ok", "error"}:
+        if status not in _RESULT_STATUSES:
             status = "ok" if value is not None else "error"
         message_value = entry.get("message")
         message = ElektrikQtPlugin._coerce_str(message_value, default="")
@@ -353,10 +353,12 @@ class ElektrikQtPlugin(QtPlugin):
             text = text.replace("Leistung:", "", 1).strip()
         return None, "error", text
 
+    def _on_tab_changed(self, index: int) -> None:
+        self._active_tab_index = index
+
     def _get_active_tab_index(self) -> int:
-        if self._tab_widget is None:
-            return self._active_tab_index
-        return int(self._tab_widget.currentIndex())
+        # Wird über currentChanged aktuell gehalten; kein Qt-Aufruf beim Export nötig.
+        return self._active_tab_index
 
 
 __all__ = ["ElektrikQtPlugin"]
@@ -46,6 +46,7 @@ from app.ui_qt.ui_helpers import (
     make_hbox,
     make_root_vbox,
     make_vbox,
+    suspended_updates,
 )
 from app.ui_qt.plugins.isolierung_support import (
     CutPlanView,
@@ -268,7 +269,7 @@ class IsolierungQtPlugin(QtPlugin):
             },
             "zuschnitt": {
                 "kerf": self._zuschnitt_inputs.get("kerf", ""),
-                "cached_plates": list(self._zuschnitt_inputs.get("cached_plates", [])),
+                "cached_plates": self._zuschnitt_inputs.get("cached_plates", []),
             },
         }
         results = {
@@ -2490,28 +2491,24 @@ class IsolierungQtPlugin(QtPlugin):
 
         if self._build_results_table is None:
             return
-        with QSignalBlocker(self._build_results_table):
-            self._build_results_table.setRowCount(0)
-            row_index = 0
-            for layer in result.layers:
-                material = "-"
-                if layer.layer_index - 1 < len(isolierungen):
-                    material_candidate = str(isolierungen[layer.layer_index - 1]).strip()
-                    material = material_candidate if material_candidate else "-"
-                for plate in layer.plates:
-                    self._build_results_table.insertRow(row_index)
-                    values = [
-                        str(layer.layer_index),
-                        material,
-                        plate.name,
-                        f"{plate.L:.3f}",
-                        f"{plate.B:.3f}",
-                        f"{plate.H:.3f}",
-                    ]
-                    for col_index, value in enumerate(values):
-                        item = QTableWidgetItem(value)
-                        self._build_results_table.setItem(row_index, col_index, item)
-                    row_index += 1
+        rows: list[tuple[str, ...]] = []
+        for layer in result.layers:
+            material = "-"
+            if layer.layer_index - 1 < len(isolierungen):
+                material_candidate = str(isolierungen[layer.layer_index - 1]).strip()
+                material = material_candidate if material_candidate else "-"
+            layer_text = str(layer.layer_index)
+            rows.extend(
+                (layer_text, material, plate.name, f"{plate.L:.3f}", f"{plate.B:.3f}", f"{plate.H:.3f}")
+                for plate in layer.plates
+            )
+        with suspended_updates(self._build_results_table) as table:
+            table.setRowCount(0)
+            table.setRowCount(len(rows))
+            set_item = table.setItem
+            for row_index, values in enumerate(rows):
+                for col_index, value in enumerate(values):
+                    set_item(row_index, col_index, QTableWidgetItem(value))
         self._restore_build_selection()
 
     def _on_build_result_selection_changed(self) -> None:
@@ -43,6 +43,17 @@ class QtPluginManager:
             if widget is not None and hasattr(self._context.tab_widget, "addTab"):
                 self._context.tab_widget.addTab(widget, plugin.name)
 
+    def get_plugin(self, plugin_id: str) -> QtPlugin | None:
+        return self._plugins.get(plugin_id)
+
+    def export_state(self, plugin_id: str) -> dict | None:
+        """Exportiert den State eines einzelnen Plugins (``None``, falls nicht geladen)."""
+
+        plugin = self._plugins.get(plugin_id)
+        if plugin is None:
+            return None
+        return plugin.export_state()
+
     def export_all_states(self) -> dict[str, dict]:
         states: dict[str, dict] = {}
         for plugin_id, plugin in self._plugins.items():
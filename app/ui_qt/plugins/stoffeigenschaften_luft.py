@@ -21,6 +21,7 @@ from app.ui_qt.ui_helpers import (
     create_button_row,
     create_page_layout,
     make_grid,
+    set_input_error,
 )
 from SoffeigenschaftenLuft.core.flow_calculations import compute_flow_properties
 from SoffeigenschaftenLuft.core.heater_calculations import compute_heater_power
@@ -1134,7 +1135,7 @@ class StoffeigenschaftenLuftQtPlugin(QtPlugin):
             self._mark_error(entry)
             return None
         try:
-            entry.setStyleSheet("color: black;")
+            set_input_error(entry, False)
             return float(raw)
         except ValueError:
             self._mark_error(entry)
@@ -1147,7 +1148,7 @@ class StoffeigenschaftenLuftQtPlugin(QtPlugin):
         if not raw or raw == "Bitte eintragen!":
             return None
         try:
-            entry.setStyleSheet("color: black;")
+            set_input_error(entry, False)
             return float(raw)
         except ValueError:
             self._mark_error(entry)
@@ -1156,7 +1157,7 @@ class StoffeigenschaftenLuftQtPlugin(QtPlugin):
     def _mark_error(self, entry: QLineEdit | None) -> None:
         if entry is None:
             return
-        entry.setStyleSheet("color: red;")
+        set_input_error(entry, True)
         entry.setText("Bitte eintragen!")
 
     def _set_tab1_error(self, message: str) -> None:
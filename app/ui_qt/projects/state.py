@@ -60,7 +60,7 @@ class PluginStateCoordinator:
                 logger.exception("Failed to import state for plugin %s.", plugin_id)
                 errors.append(f"{plugin_id}: {exc}")
         for plugin_id in states:
-            if plugin_id not in self._plugin_manager.plugins:
+            if self._plugin_manager.get_plugin(plugin_id) is None:
                 unknown.append(plugin_id)
         logger.info(
             "Applied plugin states. Missing=%s Unknown=%s Errors=%s",
@@ -72,7 +72,7 @@ class PluginStateCoordinator:
 
     def _iter_plugins_in_order(self) -> Iterable[tuple[str, QtPlugin]]:
         for spec in self._plugin_specs:
-            plugin = self._plugin_manager.plugins.get(spec.identifier)
+            plugin = self._plugin_manager.get_plugin(spec.identifier)
             if plugin is None:
                 continue
             yield spec.identifier, plugin
@@ -48,6 +48,7 @@ from app.ui_qt.ui_helpers import (
     create_page_layout,
     make_grid,
     make_vbox,
+    suspended_updates,
 )
 
 logger = logging.getLogger(__name__)
@@ -86,6 +87,7 @@ class ProjectsTab:
         self._spec_lookup = {spec.identifier: spec.name for spec in self._plugin_specs}
 
         self._project_cache: dict[str, ProjectRecord] = {}
+        self._project_items: dict[str, QListWidgetItem] = {}
         self._selected_project_id: str | None = None
         self._active_project_id: str | None = None
         self._workspace_plugin_states: dict[str, dict[str, Any]] = {}
@@ -203,6 +205,7 @@ class ProjectsTab:
             ["Projekt-Isolierung", "Aktiv", "Lokal verknüpft", "Lokalstatus", "Hinweis", "Aktion"]
         )
         self._insulation_resolution_table.verticalHeader().setVisible(False)
+        self._insulation_resolution_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self._insulation_resolution_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._insulation_resolution_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         self._insulation_resolution_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
@@ -255,13 +258,16 @@ class ProjectsTab:
         previous_selection = self._selected_project_id
         records = self._store.list_projects()
         self._project_cache = {record.id: record for record in records}
-        self._project_list.blockSignals(True)
-        self._project_list.clear()
-        for record in records:
-            item = QListWidgetItem(self._format_project_label(record))
-            item.setData(self._user_role(), record.id)
-            self._project_list.addItem(item)
-        self._project_list.blockSignals(False)
+        with suspended_updates(self._project_list) as project_list:
+            if not self._update_project_items_in_place(records):
+                project_list.clear()
+                project_list.addItems([self._format_project_label(record) for record in records])
+                user_role = self._user_role()
+                self._project_items = {}
+                for row, record in enumerate(records):
+                    item = project_list.item(row)
+                    item.setData(user_role, record.id)
+                    self._project_items[record.id] = item
         if previous_selection and previous_selection in self._project_cache:
             self._select_project_by_id(previous_selection)
         else:
@@ -270,14 +276,83 @@ class ProjectsTab:
         self._update_active_project_label()
         self._update_action_buttons()
 
-    def _select_project_by_id(self, project_id: str) -> None:
-        for row in range(self._project_list.count()):
-            item = self._project_list.item(row)
-            if item is None:
+    def _update_project_items_in_place(self, records: Sequence[ProjectRecord]) -> bool:
+        """Gleicht die Projektliste mit ``records`` ab, ohne sie neu aufzubauen.
+
+        Entfernt fehlende Einträge, fügt neue an ihrer Position ein und ändert
+        nur geänderte Beschriftungen. Liefert ``False``, wenn die Liste leer ist
+        oder sich die Reihenfolge bestehender Projekte geändert hat; dann ist ein
+        vollständiger Neuaufbau günstiger.
+        """
+
+        project_list = self._project_list
+        user_role = self._user_role()
+        current_ids = [project_list.item(row).data(user_role) for row in range(project_list.count())]
+        if not current_ids:
+            return False
+        new_ids = {record.id for record in records}
+        current_set = set(current_ids)
+        kept_ids = [project_id for project_id in current_ids if project_id in new_ids]
+        if kept_ids != [record.id for record in records if record.id in current_set]:
+            return False
+        for row in range(len(current_ids) - 1, -1, -1):
+            if current_ids[row] not in new_ids:
+                project_list.takeItem(row)
+                self._project_items.pop(current_ids[row], None)
+        for row, record in enumerate(records):
+            label = self._format_project_label(record)
+            if record.id in current_set:
+                item = project_list.item(row)
+                if item.text() != label:
+                    item.setText(label)
                 continue
-            if item.data(self._user_role()) == project_id:
-                self._project_list.setCurrentRow(row)
-                return
+            item = QListWidgetItem(label)
+            item.setData(user_role, record.id)
+            project_list.insertItem(row, item)
+            self._project_items[record.id] = item
+        return True
+
+    def _upsert_project_item(self, record: ProjectRecord) -> None:
+        """Aktualisiert nur den Listeneintrag eines gespeicherten Projekts.
+
+        Gespeicherte Projekte sind die zuletzt aktualisierten und stehen daher
+        in der nach Änderungsdatum sortierten Liste ganz oben.
+        """
+
+        self._project_cache[record.id] = record
+        row = self._project_row(record.id)
+        with suspended_updates(self._project_list) as project_list:
+            if row >= 0:
+                item = project_list.takeItem(row)
+                item.setText(self._format_project_label(record))
+            else:
+                item = QListWidgetItem(self._format_project_label(record))
+                item.setData(self._user_role(), record.id)
+                self._project_items[record.id] = item
+            project_list.insertItem(0, item)
+        self._select_project_by_id(record.id)
+        self._update_active_project_label()
+        self._update_action_buttons()
+
+    def _remove_project_item(self, project_id: str) -> None:
+        self._project_cache.pop(project_id, None)
+        row = self._project_row(project_id)
+        self._project_items.pop(project_id, None)
+        if row >= 0:
+            with suspended_updates(self._project_list) as project_list:
+                project_list.takeItem(row)
+        self._project_list.setCurrentRow(-1)
+        self._update_active_project_label()
+        self._update_action_buttons()
+
+    def _project_row(self, project_id: str) -> int:
+        item = self._project_items.get(project_id)
+        return self._project_list.row(item) if item is not None else -1
+
+    def _select_project_by_id(self, project_id: str) -> None:
+        row = self._project_row(project_id)
+        if row >= 0:
+            self._project_list.setCurrentRow(row)
 
     def _on_project_selected(self, current: object, _previous: object) -> None:
         project_id = None
@@ -400,7 +475,7 @@ class ProjectsTab:
             insulation_resolution=record.insulation_resolution,
         )
         self._active_runtime_insulation_items = runtime_after_save.resolved_items
-        self.refresh_projects()
+        self._upsert_project_item(record)
         self._update_active_project_label()
         self._refresh_insulation_resolution_ui()
         self._set_dirty(False)
@@ -490,7 +565,7 @@ class ProjectsTab:
             self._selected_project_id = None
             if self._active_project_id == record.id:
                 self._activate_unsaved_workspace(reset_plugins=True)
-            self.refresh_projects()
+            self._remove_project_item(record.id)
             self._set_status("Projekt gelöscht. Ungespeicherte Arbeitsfläche aktiv.")
         else:
             self._show_error("Fehler", "Projekt konnte nicht gelöscht werden.")
@@ -785,9 +860,8 @@ class ProjectsTab:
         self._active_insulation_resolution = {"entries": []}
         self._active_runtime_insulation_items = []
         self._set_preview_mode(False)
-        self._project_list.blockSignals(True)
-        self._project_list.setCurrentRow(-1)
-        self._project_list.blockSignals(False)
+        with suspended_updates(self._project_list) as project_list:
+            project_list.setCurrentRow(-1)
         self._update_active_project_label()
         self._refresh_insulation_resolution_ui()
         if reset_dirty:
@@ -819,32 +893,35 @@ class ProjectsTab:
             "Isolierungsquellen aktiv: 'Aktiv' zeigt die wirksame Quelle, "
             "'Lokalstatus' zeigt Synchronität/Abweichung zur eingebetteten Importversion."
         )
-        self._insulation_resolution_table.setRowCount(len(items))
-        for row, item in enumerate(items):
-            label = item.family_name
-            if item.variant_name:
-                label += f" / {item.variant_name}"
-            label += f" ({item.project_insulation_key})"
-            self._insulation_resolution_table.setItem(row, 0, QTableWidgetItem(label))
-            active = item.effective_source
-            if item.requested_source != item.effective_source:
-                active = f"{active} (statt {item.requested_source})"
-            self._insulation_resolution_table.setItem(row, 1, QTableWidgetItem(active))
-            linked_text = "ja" if item.linked_local else "nein"
-            self._insulation_resolution_table.setItem(row, 2, QTableWidgetItem(linked_text))
-            self._insulation_resolution_table.setItem(row, 3, QTableWidgetItem(item.local_status))
-            hint_text = item.local_status_hint or item.warning or "–"
-            self._insulation_resolution_table.setItem(row, 4, QTableWidgetItem(hint_text))
-            action_cell = QWidget()
-            action_layout = create_button_row(
-                [
-                    self._build_source_button("Embedded aktivieren", item.project_insulation_key, "embedded"),
-                    self._build_source_button("Lokal aktivieren", item.project_insulation_key, "local"),
-                ]
-            )
-            action_cell.setLayout(action_layout)
-            self._insulation_resolution_table.setCellWidget(row, 5, action_cell)
-        self._insulation_resolution_table.resizeRowsToContents()
+        with suspended_updates(self._insulation_resolution_table) as table:
+            table.setRowCount(len(items))
+            set_item = table.setItem
+            for row, item in enumerate(items):
+                label = item.family_name
+                if item.variant_name:
+                    label += f" / {item.variant_name}"
+                label += f" ({item.project_insulation_key})"
+                active = item.effective_source
+                if item.requested_source != item.effective_source:
+                    active = f"{active} (statt {item.requested_source})"
+                cell_texts = (
+                    label,
+                    active,
+                    "ja" if item.linked_local else "nein",
+                    item.local_status,
+                    item.local_status_hint or item.warning or "–",
+                )
+                for column, text in enumerate(cell_texts):
+                    set_item(row, column, QTableWidgetItem(text))
+                action_cell = QWidget()
+                action_layout = create_button_row(
+                    [
+                        self._build_source_button("Embedded aktivieren", item.project_insulation_key, "embedded"),
+                        self._build_source_button("Lokal aktivieren", item.project_insulation_key, "local"),
+                    ]
+                )
+                action_cell.setLayout(action_layout)
+                table.setCellWidget(row, 5, action_cell)
 
     def _build_source_button(self, label: str, project_key: str, source: str) -> QPushButton:
         button = QPushButton(label)
@@ -883,7 +960,7 @@ class ProjectsTab:
         self._active_runtime_insulation_items = resolved.resolved_items
         self._refresh_insulation_resolution_ui()
         try:
-            self._store.save_project(
+            record = self._store.save_project(
                 name=record.name,
                 author=record.author,
                 description=record.description,
@@ -898,8 +975,7 @@ class ProjectsTab:
         except ValueError as exc:
             self._show_error("Fehler", f"Projekt konnte nach Umschaltung nicht gespeichert werden: {exc}")
             return
-        self.refresh_projects()
-        self._select_project_by_id(record.id)
+        self._upsert_project_item(record)
         self._set_status(f"Isolierungsquelle für {project_key} explizit auf '{target_source}' umgeschaltet.")
         if self._on_project_loaded is not None:
             self._on_project_loaded()
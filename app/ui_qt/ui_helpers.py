@@ -1,8 +1,9 @@
 """Helper utilities for consistent Qt layout defaults."""
 from __future__ import annotations
 
-from collections.abc import Sequence
-
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -134,17 +135,12 @@ def create_section_header(
     text_layout.setSpacing(HEADER_TEXT_SPACING)
 
     title_label = QLabel(title)
-    title_font = QFont()
-    title_font.setPointSize(HEADER_TITLE_SIZE)
-    title_font.setBold(True)
-    title_label.setFont(title_font)
+    title_label.setFont(_header_font(HEADER_TITLE_SIZE, QFont.Weight.Bold))
     text_layout.addWidget(title_label)
 
     if subtitle:
         subtitle_label = QLabel(subtitle)
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(HEADER_SUBTITLE_SIZE)
-        subtitle_label.setFont(subtitle_font)
+        subtitle_label.setFont(_header_font(HEADER_SUBTITLE_SIZE))
         text_layout.addWidget(subtitle_label)
 
     layout.addLayout(text_layout)
@@ -157,13 +153,76 @@ def create_section_header(
     return header
 
 
+@contextmanager
+def suspended_updates(widget: QWidget) -> Iterator[QWidget]:
+    """Unterdrückt Repaints und Signale eines Widgets während eines Bulk-Updates."""
+
+    updates_enabled = widget.updatesEnabled()
+    signals_blocked = widget.blockSignals(True)
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(signals_blocked)
+        widget.setUpdatesEnabled(updates_enabled)
+
+
+INPUT_ERROR_PROPERTY = "input_error"
+
+
+APP_STYLE_SHEET = (
+    "QPushButton { min-height: 28px; }"
+    "QLineEdit, QTextEdit, QComboBox { min-height: 24px; }"
+    "QHeaderView::section { padding: 4px 6px; }"
+    f'QLineEdit[{INPUT_ERROR_PROPERTY}="true"] {{ color: red; }}'
+)
+
+
 def apply_app_style(app: object) -> None:
-    if hasattr(app, "setStyleSheet"):
-        app.setStyleSheet(
-            "QPushButton { min-height: 28px; }"
-            "QLineEdit, QTextEdit, QComboBox { min-height: 24px; }"
-            "QHeaderView::section { padding: 4px 6px; }"
-        )
+    """Setzt das App-Stylesheet; ein erneuter Aufruf ohne Änderung ist wirkungslos."""
+
+    if not hasattr(app, "setStyleSheet"):
+        return
+    # setStyleSheet poliert alle Widgets neu, auch bei identischem Inhalt.
+    if hasattr(app, "styleSheet") and app.styleSheet() == APP_STYLE_SHEET:
+        return
+    app.setStyleSheet(APP_STYLE_SHEET)
+
+
+def set_input_error(widget: QWidget, error: bool) -> None:
+    """Markiert ein Eingabefeld über eine Property statt über ein eigenes Stylesheet.
+
+    Die Regel steht einmalig im App-Stylesheet; neu gestylt wird nur bei einem
+    tatsächlichen Zustandswechsel.
+    """
+
+    if bool(widget.property(INPUT_ERROR_PROPERTY)) == error:
+        return
+    widget.setProperty(INPUT_ERROR_PROPERTY, error)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+@lru_cache(maxsize=None)
+def _header_font(point_size: int, weight: QFont.Weight | None = None) -> QFont:
+    # QLabel.setFont kopiert den Font; die gecachte Instanz bleibt unverändert.
+    font = QFont()
+    font.setPointSize(point_size)
+    if weight is not None:
+        font.setWeight(weight)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _svg_logo_width(logo_path: str, height: int) -> int | None:
+    renderer = QSvgRenderer(logo_path)
+    if not renderer.isValid():
+        return None
+    size = renderer.defaultSize()
+    if not size.isValid() or size.height() <= 0:
+        return height
+    return max(1, round(size.width() * height / size.height()))
 
 
 def _create_logo_widget(logo_path: Path, height: int) -> QWidget | None:
@@ -171,14 +230,9 @@ def _create_logo_widget(logo_path: Path, height: int) -> QWidget | None:
         return None
 
     if logo_path.suffix.lower() == ".svg":
-        renderer = QSvgRenderer(str(logo_path))
-        if not renderer.isValid():
+        width = _svg_logo_width(str(logo_path), height)
+        if width is None:
             return None
-        size = renderer.defaultSize()
-        if not size.isValid() or size.height() <= 0:
-            width = height
-        else:
-            width = max(1, round(size.width() * height / size.height()))
 
         logo_widget = QSvgWidget(str(logo_path))
         logo_widget.setFixedSize(width, height)
@@ -214,18 +268,13 @@ def create_page_header(
     title_layout.setSpacing(HEADER_TEXT_SPACING)
 
     title_label = QLabel(title)
-    title_font = QFont()
-    title_font.setPointSize(HEADER_TITLE_SIZE)
-    title_font.setWeight(QFont.Weight.DemiBold)
-    title_label.setFont(title_font)
+    title_label.setFont(_header_font(HEADER_TITLE_SIZE, QFont.Weight.DemiBold))
     title_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
     title_layout.addWidget(title_label)
 
     if subtitle:
         subtitle_label = QLabel(subtitle)
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(HEADER_SUBTITLE_SIZE)
-        subtitle_label.setFont(subtitle_font)
+        subtitle_label.setFont(_header_font(HEADER_SUBTITLE_SIZE))
         title_layout.addWidget(subtitle_label)
 
     layout.addLayout(title_layout)
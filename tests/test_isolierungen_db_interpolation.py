@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from app.core.isolierungen_db.logic import interpolate_k
+
+
+class InterpolateKTests(unittest.TestCase):
+    def test_duplicate_temperatures_are_averaged(self):
+        x_range = np.array([100.0, 200.0, 300.0])
+
+        result = interpolate_k([300.0, 100.0, 100.0, 200.0], [0.3, 0.1, 0.2, 0.2], x_range)
+
+        np.testing.assert_allclose(result, [0.15, 0.2, 0.3])
+
+    def test_nearly_equal_temperatures_form_one_group(self):
+        x_range = np.array([50.0])
+
+        result = interpolate_k([50.0, 50.0 + 1e-9], [0.1, 0.3], x_range)
+
+        np.testing.assert_allclose(result, [0.2])
+
+    def test_two_points_use_linear_fit(self):
+        result = interpolate_k([0.0, 100.0], [0.1, 0.2], np.array([50.0, 150.0]))
+
+        np.testing.assert_allclose(result, [0.15, 0.25])
+
+    def test_empty_input_raises(self):
+        with self.assertRaises(ValueError):
+            interpolate_k([], [], np.array([1.0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
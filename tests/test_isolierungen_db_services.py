@@ -0,0 +1,22 @@
+import unittest
+
+from app.core.isolierungen_db.services import parse_float_list
+
+
+class ParseFloatListTests(unittest.TestCase):
+    def test_comma_separated_values(self):
+        self.assertEqual(parse_float_list("20, 200,400"), [20.0, 200.0, 400.0])
+
+    def test_semicolon_separator_allows_decimal_comma(self):
+        self.assertEqual(parse_float_list("0,035; 0,041;"), [0.035, 0.041])
+
+    def test_empty_input_returns_empty_list(self):
+        self.assertEqual(parse_float_list("  "), [])
+
+    def test_invalid_entry_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            parse_float_list("20, abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
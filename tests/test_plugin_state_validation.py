@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from app.ui_qt.plugins.base import QtPlugin
+
+
+class _Plugin(QtPlugin):
+    name = "Test"
+    identifier = "test"
+
+    def attach(self, context) -> None:
+        return None
+
+
+def test_validate_state_accepts_nested_json_values() -> None:
+    state = {
+        "inputs": {"layers": [{"name": "A", "thickness": 40.0, "active": True, "note": None}]},
+        "results": {"data": [[1, 2], [3]]},
+        "ui": {},
+    }
+
+    assert _Plugin().validate_state(state) == state
+
+
+@pytest.mark.parametrize(
+    ("state", "message"),
+    [
+        ({"inputs": {"layers": [{"name": object()}]}}, "Unsupported value at inputs.layers[0].name: object."),
+        ({"results": {"data": [1, {2: "x"}]}}, "Non-string dict key at results.data[1]: 2."),
+        ({"ui": {"values": (1, 2)}}, "Unsupported value at ui.values: tuple."),
+        (
+            {"inputs": {"a": {"b": object()}, "c": object()}, "results": {"x": set()}},
+            "Unsupported value at inputs.a.b: object.",
+        ),
+        ({"results": {"data": [1, object(), set()]}}, "Unsupported value at results.data[1]: object."),
+        ({"ui": {"a": object(), 1: "x"}}, "Unsupported value at ui.a: object."),
+        ({"ui": {"a": 1, 2: "x", "b": object()}}, "Non-string dict key at ui: 2."),
+    ],
+)
+def test_validate_state_reports_path_of_invalid_value(state: dict, message: str) -> None:
+    with pytest.raises(TypeError) as error:
+        _Plugin().validate_state(state)
+
+    assert str(error.value) == message
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import tempfile
 import unittest
 from pathlib import Path
@@ -21,3 +22,20 @@ class ProjectStoreErrorHandlingTests(unittest.TestCase):
             path.write_text('{"format_version": 1, "projects": {}}', encoding="utf-8")
             with self.assertRaises(ProjectStoreLoadError):
                 ProjectStore(path=path)
+
+    def test_non_finite_floats_survive_save_and_reload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "projects.json"
+            record = ProjectStore(path=path).save_project(
+                name="Test",
+                author="Tester",
+                plugin_states={"demo": {"results": {"nan": math.nan, "inf": math.inf, "neg": -math.inf}}},
+            )
+
+            loaded = ProjectStore(path=path).load_project(record.id)
+
+            self.assertIsNotNone(loaded)
+            results = loaded.plugin_states["demo"]["results"]
+            self.assertTrue(math.isnan(results["nan"]))
+            self.assertEqual(results["inf"], math.inf)
+            self.assertEqual(results["neg"], -math.inf)
@@ -6,6 +6,7 @@ from app.core.reporting.builders import (
     build_isolierung_report_by_type,
     resolve_isolierung_report_metadata,
 )
+from app.core.reporting.builders.isolierung import _numbers_from_sequence
 
 
 def _plugin_state() -> dict[str, object]:
@@ -129,3 +130,10 @@ def test_metadata_resolution_uses_report_type_specific_default_title() -> None:
     )
 
     assert metadata["title"] == "Schichtaufbau und Zuschnittplanung der Isolierung"
+
+
+def test_numbers_from_sequence_skips_entries_that_are_not_numbers() -> None:
+    assert _numbers_from_sequence([1.0, None, 3]) == [1.0, 3.0]
+    assert _numbers_from_sequence([120, "70", True, "x"]) == [120.0, 70.0, 1.0]
+    assert _numbers_from_sequence([[1.0], 2.0]) == [2.0]
+    assert _numbers_from_sequence([20.5, 30, 40.0], max_items=2) == [20.5, 30.0]
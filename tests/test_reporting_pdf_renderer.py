@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from io import BytesIO
+
+from PIL import Image
 
 from app.core.reporting.builders import (
     ISOLIERUNG_REPORT_TYPE_SCHICHTAUFBAU_ZUSCHNITT,
@@ -12,6 +15,7 @@ from app.core.reporting.renderers.pdf import (
     _compact_dimension_rows,
     _detect_summary_row_index,
     _format_datetime,
+    _header_logo_png,
 )
 from app.core.reporting.report_document import MetricItem, TableBlock, TableColumn, TableRow
 from app.core.reporting.renderers import render_report_pdf
@@ -144,3 +148,12 @@ def test_detect_summary_row_index_finds_sum_rows() -> None:
     )
 
     assert _detect_summary_row_index(table) == 2
+
+
+def test_header_logo_png_is_downscaled_with_aspect_ratio(tmp_path) -> None:
+    source = tmp_path / "logo.png"
+    Image.new("RGBA", (4000, 1000), (255, 0, 0, 128)).save(source)
+
+    with Image.open(BytesIO(_header_logo_png(source))) as logo:
+        assert logo.size == (400, 100)
+        assert logo.mode == "RGBA"